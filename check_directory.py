@@ -1,3 +1,6 @@
+import os
+import sys
+from collections import Counter
 from pathlib import Path
 
 def print_directory_structure(startpath: str, exclude_dirs: set = None):
@@ -12,23 +15,27 @@ def print_directory_structure(startpath: str, exclude_dirs: set = None):
         exclude_dirs = {'.git', '__pycache__', 'venv', '.idea'}
     
     startpath = Path(startpath)
+    # 出力は行のリストにまとめ、最後に1回で書き出す
+    lines = []
     
-    def _print_tree(path: Path, prefix: str = ''):
-        entries = sorted([x for x in path.iterdir() if x.name not in exclude_dirs])
+    def _print_tree(path: str, prefix: str = ''):
+        with os.scandir(path) as it:
+            entries = sorted((x for x in it if x.name not in exclude_dirs), key=lambda x: x.name)
         
         for i, entry in enumerate(entries):
             is_last = i == len(entries) - 1
             connector = '└── ' if is_last else '├── '
             
-            print(f"{prefix}{connector}{entry.name}")
+            lines.append(f"{prefix}{connector}{entry.name}\n")
             
             if entry.is_dir():
                 extension = '    ' if is_last else '│   '
-                _print_tree(entry, prefix + extension)
+                _print_tree(entry.path, prefix + extension)
     
-    print(f"\n📁 プロジェクトディレクトリ構造: {startpath.absolute()}")
-    print(".")
-    _print_tree(startpath)
+    lines.append(f"\n📁 プロジェクトディレクトリ構造: {startpath.absolute()}\n")
+    lines.append(".\n")
+    _print_tree(str(startpath))
+    sys.stdout.write(''.join(lines))
 
 def get_file_info(path: str):
     """
@@ -37,19 +44,34 @@ def get_file_info(path: str):
     Args:
         path (str): 確認するディレクトリパス
     """
-    path = Path(path)
-    
     print(f"\n📊 ファイル統計:")
     
+    def walk(p: str):
+        # DirEntryはstat結果をキャッシュするため、ファイルごとのstatは1回で済む
+        try:
+            it = os.scandir(p)
+        except PermissionError:
+            # 読み取り権限のないディレクトリは集計から除外する
+            return
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from walk(entry.path)
+                else:
+                    yield entry
+    
     # ファイル拡張子ごとの統計
-    extension_count = {}
+    extension_count = Counter()
     total_size = 0
     
-    for file_path in path.rglob('*'):
-        if file_path.is_file():
-            ext = file_path.suffix.lower()
-            extension_count[ext] = extension_count.get(ext, 0) + 1
-            total_size += file_path.stat().st_size
+    for entry in walk(path):
+        if entry.is_file(follow_symlinks=False):
+            # Path.suffix と同じ規則で拡張子を取り出す（先頭のドットのみの名前は拡張子なし）
+            name = entry.name
+            i = name.rfind('.')
+            ext = name[i:].lower() if 0 < i < len(name) - 1 else ''
+            extension_count[ext] += 1
+            total_size += entry.stat(follow_symlinks=False).st_size
     
     # 拡張子ごとの統計を表示
     print("\n拡張子ごとのファイル数:")
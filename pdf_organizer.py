@@ -1,23 +1,357 @@
+import csv
+import errno
+import hashlib
+import json
+import os
 import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
 import re
-from typing import Dict, Any
-from collections import defaultdict
+from typing import Callable, Dict, Any, Iterator, Optional
+from collections import Counter
+from itertools import groupby
 import logging
 from datetime import datetime
 import pdfplumber  # 追加
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# 抽出済みテキストのキャッシュ（再実行時にPDFを解析し直さないため）
+_cache_dir = Path(".pdf_text_cache")
+
+# 統計ファイル書き込み時のバッファサイズ
+WRITE_BUFSIZE = 256 * 1024
+
+# reflink（コピーオンライト複製）を行うioctl番号（Linux）
+_FICLONE = 0x40049409
+
+class _LinkOrCopy:
+    """
+    ファイルをハードリンクで配置し、できなければreflinkまたはコピーする
+    
+    コピー元と同じファイルシステム上ではディスク領域を新たに消費しない。
+    ハードリンクの場合、配置先のファイルはコピー元と実体を共有する。
+    ファイルシステムの違いなどで一度失敗した方法は、以降のファイルでは試さない。
+    """
+    def __init__(self):
+        self.can_link = True
+        self.can_reflink = fcntl is not None and sys.platform.startswith('linux')
+
+    def __call__(self, src, dst) -> None:
+        """
+        Args:
+            src: コピー元のパス
+            dst: コピー先のパス
+        """
+        if self.can_link:
+            try:
+                os.link(src, dst)
+                return
+            except FileExistsError:
+                # 既存のファイル（コピー元へのハードリンクの場合もある）には書き込まず、
+                # 従来どおりcopy2に任せる（同一ファイルならSameFileErrorになる）
+                shutil.copy2(src, dst)
+                return
+            except OSError as e:
+                # 別のファイルシステム（EXDEV）やハードリンク非対応の場合
+                if e.errno in (errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP):
+                    self.can_link = False
+        
+        if self.can_reflink:
+            # 配置先を直接切り詰めないよう、同じディレクトリの一時ファイルに複製してから置き換える
+            dst_dir, dst_name = os.path.split(os.fspath(dst))
+            tmp = os.path.join(dst_dir, f".{dst_name}.{os.getpid()}.tmp")
+            created = False
+            try:
+                with open(src, 'rb') as fsrc, open(tmp, 'xb') as fdst:
+                    created = True
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                shutil.copystat(src, tmp)
+                os.replace(tmp, dst)
+                return
+            except OSError as e:
+                if created:
+                    try:
+                        os.remove(tmp)
+                    except OSError:
+                        pass
+                # reflink非対応のファイルシステムの場合
+                if e.errno in (errno.EXDEV, errno.EOPNOTSUPP, errno.EINVAL, errno.ENOTTY):
+                    self.can_reflink = False
+        
+        shutil.copy2(src, dst)
+
+def _has_classification_fields(text: str) -> bool:
+    """
+    分類に必要な項目（案件名と品名/追加支払い）がテキストに揃ったかを判定する
+    
+    Args:
+        text (str): ここまでに抽出したテキスト
+        
+    Returns:
+        bool: 残りのページを読む必要がなければTrue
+    """
+    return '案件名' in text and ('品名' in text or '追加支払い' in text or len(text) > 500)
+
+def _read_pdf_text(path_str: str, records: list[tuple[int, str]],
+                   stop_predicate: Optional[Callable[[str], bool]] = None,
+                   debug: bool = False) -> str:
+    """
+    pdfplumberでPDFファイルからテキストを抽出する
+    
+    Args:
+        path_str (str): PDFファイルのパス
+        records (list[tuple[int, str]]): ログを追加するリスト
+        stop_predicate (Optional[Callable[[str], bool]]): ここまでのテキストを受け取り、
+            Trueを返したら残りのページを読まずに終了する（Noneなら全ページを読む）
+        debug (bool): Trueならページごとの文字数やサンプル行をログに追加する
+        
+    Returns:
+        str: 抽出されたテキスト
+    """
+    try:
+        with pdfplumber.open(path_str) as pdf:
+            text = ''
+            for page_num, page in enumerate(pdf.pages, 1):
+                try:
+                    page_text = page.extract_text()
+                    text += page_text
+                    
+                    if not page_text.strip():
+                        records.append((logging.WARNING, f"  ページ {page_num}: テキストが抽出できませんでした"))
+                    elif debug:
+                        records.append((logging.DEBUG, f"  ページ {page_num}: {len(page_text)} 文字抽出"))
+                        # デバッグ用に抽出テキストの詳細を記録
+                        lines = page_text.split('\n')
+                        for i, line in enumerate(lines[:5]):  # 最初の5行をサンプルとして表示
+                            records.append((logging.DEBUG, f"    行 {i + 1}: {line}"))
+                        
+                except Exception as e:
+                    records.append((logging.ERROR, f"  ページ {page_num} の処理中にエラー: {str(e)}"))
+                finally:
+                    # ページごとの文字オブジェクトとテキストマップのキャッシュを解放し、
+                    # メモリ使用量を1ページ分に抑える（flush_cacheだけでは get_textmap のキャッシュが残る）
+                    page.close()
+                
+                if stop_predicate and stop_predicate(text):
+                    if debug and page_num < len(pdf.pages):
+                        records.append((logging.DEBUG, f"  必要な項目を検出したため {page_num} ページ目で読み込みを終了"))
+                    break
+            
+            return text
+        
+    except Exception as e:
+        records.append((logging.ERROR, f"PDFファイル処理エラー: {path_str} - {str(e)}"))
+        return ''
+
+def _predicate_cache_id(stop_predicate) -> Optional[str]:
+    """
+    キャッシュのキーに使う、読み込みの打ち切り条件の識別子を返す
+    
+    モジュールレベルで定義された関数だけを名前で識別できるものとして扱う。
+    ラムダやローカル関数、functools.partial などは名前が一意にならないため、
+    キャッシュの対象外とする。
+    
+    Args:
+        stop_predicate: 読み込みを打ち切る条件（Noneなら全ページを読む）
+        
+    Returns:
+        Optional[str]: 識別子（条件がなければ空文字列、識別できなければNone）
+    """
+    if stop_predicate is None:
+        return ''
+    module = getattr(stop_predicate, '__module__', None)
+    qualname = getattr(stop_predicate, '__qualname__', None)
+    if not module or not qualname:
+        return None
+    if getattr(sys.modules.get(module), qualname, None) is not stop_predicate:
+        return None
+    return f"{module}.{qualname}"
+
+def _cached_extract(path_str: str, records: list[tuple[int, str]],
+                    stop_predicate: Optional[Callable[[str], bool]] = None,
+                    debug: bool = False) -> str:
+    """
+    キャッシュを利用してPDFファイルからテキストを抽出する
+    
+    キャッシュのキーは (パス, 更新時刻, サイズ) から作るため、
+    ファイルが更新されると自動的に抽出し直す。途中で打ち切ったテキストは
+    全ページのテキストとは別のキーで保存する。抽出時のWARNING以上のログも
+    テキストと一緒に保存し、キャッシュから読み込んだ場合も同じログを返す。
+    
+    Args:
+        path_str (str): PDFファイルのパス
+        records (list[tuple[int, str]]): ログを追加するリスト
+        stop_predicate (Optional[Callable[[str], bool]]): 読み込みを打ち切る条件
+        debug (bool): Trueならデバッグ用のログを追加する
+        
+    Returns:
+        str: 抽出されたテキスト
+    """
+    # 読み込みの打ち切り条件を特定できない場合（ラムダなど）はキャッシュを使わない
+    predicate_id = _predicate_cache_id(stop_predicate)
+    if predicate_id is None:
+        return _read_pdf_text(path_str, records, stop_predicate, debug)
+    
+    try:
+        st = os.stat(path_str)
+    except OSError:
+        return _read_pdf_text(path_str, records, stop_predicate, debug)
+    
+    key_source = f"{path_str}|{st.st_mtime_ns}|{st.st_size}"
+    if predicate_id:
+        key_source += f"|{predicate_id}"
+    key = hashlib.blake2b(key_source.encode()).hexdigest()[:32]
+    cache_file = _cache_dir / key[:2] / f"{key}.json"
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        text = cached['text']
+        if debug:
+            records.append((logging.DEBUG, f"  キャッシュからテキストを読み込み: {cache_file}"))
+        records.extend((level, message) for level, message in cached['records'])
+        return text
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    first_record = len(records)
+    text = _read_pdf_text(path_str, records, stop_predicate, debug)
+    if text:
+        # デバッグ用のログは保存せず、警告やエラーだけを残す
+        saved_records = [r for r in records[first_record:] if r[0] >= logging.WARNING]
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # 書き込み途中のファイルを読まないよう、一時ファイルから置き換える
+            tmp_file = cache_file.with_name(f"{key}.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps({'text': text, 'records': saved_records}, ensure_ascii=False),
+                                encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except (OSError, ValueError) as e:
+            records.append((logging.WARNING, f"  キャッシュの保存に失敗: {cache_file} - {str(e)}"))
+    return text
+
+def _extract_text(path_str: str, stop_predicate: Optional[Callable[[str], bool]] = None,
+                  debug: bool = False) -> tuple[str, str, list[tuple[int, str]]]:
+    """
+    PDFファイルからテキストを抽出する（ワーカープロセス用）
+    
+    ログハンドラはプロセス間で共有しないため、ログは (レベル, メッセージ) の
+    リストとして返し、メインプロセス側で記録する。
+    
+    Args:
+        path_str (str): PDFファイルのパス
+        stop_predicate (Optional[Callable[[str], bool]]): 読み込みを打ち切る条件
+            （プロセス間で受け渡すため、モジュールレベルの関数を指定する）
+        debug (bool): Trueならデバッグ用のログを追加する
+            （ワーカープロセスにはログ設定が引き継がれないため、呼び出し側で判定する）
+        
+    Returns:
+        tuple[str, str, list[tuple[int, str]]]: (パス, 抽出されたテキスト, ログ)
+    """
+    records = []
+    text = _cached_extract(path_str, records, stop_predicate, debug)
+    return path_str, text, records
+
+def _extract_in_pool(extract: Callable[[str], tuple], pdf_files: list[str]
+                     ) -> Iterator[tuple[str, Optional[tuple], Optional[Exception]]]:
+    """
+    複数プロセスでテキストを抽出し、入力順に結果を返す
+    
+    ファイルごとの例外は結果として返すため、1つのファイルの失敗で全体が
+    止まることはない。ワーカープロセスが異常終了した場合（メモリ不足による
+    強制終了など）は、そのファイルを失敗として返し、残りのファイルは新しい
+    プロセスプールで処理を続ける。
+    
+    Args:
+        extract (Callable[[str], tuple]): ワーカープロセスで実行する抽出関数
+        pdf_files (list[str]): PDFファイルのパスのリスト
+        
+    Yields:
+        tuple[str, Optional[tuple], Optional[Exception]]: (パス, 抽出結果, 例外)
+    """
+    start = 0
+    while start < len(pdf_files):
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            remaining = pdf_files[start:]
+            futures = [executor.submit(extract, pdf_path) for pdf_path in remaining]
+            for pdf_path, future in zip(remaining, futures):
+                start += 1
+                try:
+                    yield pdf_path, future.result(), None
+                except BrokenProcessPool as e:
+                    # プールが使えなくなったため、残りは新しいプールで処理する
+                    yield pdf_path, None, e
+                    break
+                except Exception as e:
+                    yield pdf_path, None, e
+
+def _path_key(path: str) -> tuple:
+    """
+    パス文字列をPathオブジェクトと同じ順序（構成要素ごと）で並べるためのキー
+    
+    Args:
+        path (str): パス文字列（'.' はカレントディレクトリ）
+        
+    Returns:
+        tuple: 並べ替え用のキー
+    """
+    if path == '.':
+        return ()
+    return tuple(os.path.normcase(path).split(os.sep))
+
+def _project_stats_key(item: tuple) -> tuple:
+    """project_stats の項目 ((案件名, ソースディレクトリ, ユーザー名), 件数) の並べ替えキー"""
+    (project, source_dir, username), _ = item
+    return project, _path_key(source_dir), username
+
+def _user_stats_key(item: tuple) -> tuple:
+    """user_stats の項目 ((ユーザー名, 案件名, ソースディレクトリ), 件数) の並べ替えキー"""
+    (username, project, source_dir), _ = item
+    return username, project, _path_key(source_dir)
+
 class PDFOrganizer:
-    def __init__(self, source_dir: str, destination_dir: str):
+    # アナライザーと同じパターン定義
+    TEXT_PATTERNS = {
+        '領収書番号': r'領収書番号[：:]\s*([0-9]+)',
+        '発行日': r'発[行⾏]日[：:]\s*(\d{4}年\d{1,2}月\d{1,2}日)',
+        '宛名': r'([一-龥々ぁ-んァ-ヶ\s]{1,20})[様殿]',
+        '領収者': r'領収者[：\s]*([一-龥々ぁ-んァ-ヶ]{1,20})',
+        '金額': r'[￥¥]\s*([0-9,]+)',
+        '案件名': r'案件名[：:]\s*(.+)'
+    }
+    # 事前にコンパイルしたパターン
+    _PATTERNS = {key: re.compile(pattern) for key, pattern in TEXT_PATTERNS.items()}
+    # 案件名や表は1ページ目の冒頭にあるため、まずこの文字数までを検索する
+    HEAD_SIZE = 2048
+    # 表の見出しの次の行から相手先（ユーザー名）を抽出するパターン
+    TABLE_USERNAME_PATTERN = re.compile(r'\s([a-zA-Z0-9._\-]+)\s+\d+\s+個')
+    # 表の見出しの次の行から品名と相手先を抽出するパターン
+    TABLE_ROW_PATTERN = re.compile(
+        r'(.*?)\s+([a-zA-Z0-9._-]+|[一-龥々ぁ-んァ-ヶ]+\s*[一-龥々ぁ-んァ-ヶ]+|[A-Z]\.\s*[A-Za-z]+)\s+\d+'
+    )
+
+    def __init__(self, source_dir: str, destination_dir: str, link_mode: str = 'auto'):
         """
         PDFファイルを整理するクラスの初期化
         
         Args:
             source_dir (str): PDFファイルが存在するソースディレクトリ
             destination_dir (str): 分類後のファイルを保存するディレクトリ
+            link_mode (str): 'auto' ならハードリンク/reflinkを優先し、
+                'copy' なら常にファイルをコピーする
         """
+        if link_mode not in ('auto', 'copy'):
+            raise ValueError(f"link_mode は 'auto' または 'copy' を指定してください: {link_mode}")
+        
         self.source_dir = Path(source_dir)
         self.destination_dir = Path(destination_dir)
+        self.link_mode = link_mode
         self.projects = {
             'basic': '意思決定に関する心理学実験 (実験参加)',
             'additional': '意思決定に関する心理学実験 (実験参加) 追加支払い'
@@ -29,49 +363,39 @@ class PDFOrganizer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"pdf_organizer_{timestamp}.log"
         
+        # ログレベルは環境変数 PDF_ORG_LOG で指定する（例: DEBUG, 10）
+        level_name = os.environ.get('PDF_ORG_LOG', 'INFO').strip().upper()
+        level = int(level_name) if level_name.isdigit() else logging.getLevelName(level_name)
+        invalid_level = not isinstance(level, int)
+        
         logging.basicConfig(
-            level=logging.DEBUG,
+            level=logging.INFO if invalid_level else level,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.FileHandler(log_file, encoding='utf-8')
             ]
         )
+        if invalid_level:
+            logging.warning(f"PDF_ORG_LOG の値が不正なため INFO を使用します: {level_name}")
         
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+    def extract_text_from_pdf(self, pdf_path: Path,
+                              stop_predicate: Optional[Callable[[str], bool]] = None) -> str:
         """
         PDFファイルからテキストを抽出する
         
         Args:
             pdf_path (Path): PDFファイルのパス
+            stop_predicate (Optional[Callable[[str], bool]]): ここまでのテキストを受け取り、
+                Trueを返したら残りのページを読まずに終了する（Noneなら全ページを読む）
             
         Returns:
             str: 抽出されたテキスト
         """
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ''
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        text += page_text
-                        
-                        if not page_text.strip():
-                            logging.warning(f"  ページ {page_num}: テキストが抽出できませんでした")
-                        else:
-                            logging.debug(f"  ページ {page_num}: {len(page_text)} 文字抽出")
-                            # デバッグ用に抽出テキストの詳細を記録
-                            lines = page_text.split('\n')
-                            for i, line in enumerate(lines[:5]):  # 最初の5行をサンプルとして表示
-                                logging.debug(f"    行 {i + 1}: {line}")
-                            
-                    except Exception as e:
-                        logging.error(f"  ページ {page_num} の処理中にエラー: {str(e)}")
-                
-                return text
-            
-        except Exception as e:
-            logging.error(f"PDFファイル処理エラー: {pdf_path} - {str(e)}")
-            return ''
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        _, text, records = _extract_text(str(pdf_path), stop_predicate, debug)
+        for level, message in records:
+            logging.log(level, message)
+        return text
 
     def categorize_pdf(self, text: str) -> str:
         """
@@ -96,58 +420,68 @@ class PDFOrganizer:
             'patterns_found': {}
         }
 
-        # アナライザーと同じパターン定義
-        patterns = {
-            '領収書番号': r'領収書番号[：:]\s*([0-9]+)',
-            '発行日': r'発[行⾏]日[：:]\s*(\d{4}年\d{1,2}月\d{1,2}日)',
-            '宛名': r'([一-龥々ぁ-んァ-ヶ\s]{1,20})[様殿]',
-            '領収者': r'領収者[：\s]*([一-龥々ぁ-んァ-ヶ]{1,20})',
-            '金額': r'[￥¥]\s*([0-9,]+)',
-            '案件名': r'案件名[：:]\s*(.+)'
-        }
-
-        for key, pattern in patterns.items():
-            matches = re.finditer(pattern, text)
+        # 項目ごとに検索する（1つのパターンにまとめると、重なり合う一致が失われる）
+        for key, pattern in self._PATTERNS.items():
             analysis['patterns_found'][key] = [
                 {
                     'matched_text': m.group(0),
                     'captured_group': m.group(1),
                     'position': m.span()
-                } for m in matches
+                } for m in pattern.finditer(text)
             ]
 
         return analysis
 
+    def _find_pattern(self, text: str, key: str) -> Optional[str]:
+        """
+        指定したパターンの最初の一致から取り出した値を返す
+        
+        Args:
+            text (str): PDFから抽出したテキスト
+            key (str): TEXT_PATTERNS のパターン名
+            
+        Returns:
+            Optional[str]: 取り出した値（一致しなければNone）
+        """
+        m = self._PATTERNS[key].search(text)
+        return m.group(1) if m else None
+
     def extract_username(self, text: str) -> str:
         """
         テキストから相手先（ユーザー名）を抽出する
         """
-        # テキストを行に分割
-        lines = text.split('\n')
+        search_areas = self._search_areas(text)
         
-        # 案件名の行を探し、その次の行を確認
-        for i, line in enumerate(lines[:-1]):  # 最後の行を除いて処理
-            if line.startswith('案件名：'):
-                next_line = lines[i + 1].strip()
-                logging.debug(f"案件名の次の行からユーザー名を検出: {next_line}")
-                return next_line
+        # 正規表現や行分割の前に、目印となる文字列の有無を確認して
+        # 該当しない抽出方法は丸ごと省略する
+        if '案件名：' in text:
+            for area in search_areas:
+                # テキストを行に分割
+                lines = area.split('\n')
+                
+                # 案件名の行を探し、その次の行を確認
+                for i, line in enumerate(lines[:-1]):  # 最後の行を除いて処理
+                    if line.startswith('案件名：'):
+                        next_line = lines[i + 1].strip()
+                        logging.debug(f"案件名の次の行からユーザー名を検出: {next_line}")
+                        return next_line
 
         # バックアップとして他のパターンも確認
-        analysis = self.analyze_text(text)
-        patterns_found = analysis['patterns_found']
-        
         # 表形式からの抽出
-        table_match = re.search(r'品名\s+相⼿先\s+数量.*?\n.*?\s+([a-zA-Z0-9._\-]+)\s+\d+\s+個', text, re.DOTALL)
-        if table_match:
-            username = table_match.group(1).strip()
-            logging.debug(f"表形式からユーザー名を検出: {username}")
-            return username
+        for area in search_areas:
+            table_row = self._find_table_row(area)
+            table_match = table_row and self.TABLE_USERNAME_PATTERN.search(table_row)
+            if table_match:
+                username = table_match.group(1).strip()
+                logging.debug(f"表形式からユーザー名を検出: {username}")
+                return username
 
         # 領収者パターン
-        if patterns_found.get('領収者'):
-            username = patterns_found['領収者'][0]['captured_group']
-            logging.debug(f"領収者パターンからユーザー名を検出: {username}")
-            return username
+        if '領収者' in text:
+            username = self._find_pattern(text, '領収者')
+            if username:
+                logging.debug(f"領収者パターンからユーザー名を検出: {username}")
+                return username
 
         logging.warning(f"ユーザー名を検出できませんでした。テキストサンプル: {text[:200]}")
         return 'unknown_user'
@@ -156,25 +490,66 @@ class PDFOrganizer:
         """
         テキストからプロジェクトの種類を判定する
         """
-        analysis = self.analyze_text(text)
-        patterns_found = analysis['patterns_found']
+        # 追加支払いの記載がなければ基本案件
+        if '追加支払い' not in text:
+            logging.debug("基本案件として判定")
+            return 'basic'
         
         # 案件名から判定
-        if '案件名' in patterns_found and patterns_found['案件名']:
-            project_name = patterns_found['案件名'][0]['captured_group']
-            if '追加支払い' in project_name:
-                logging.debug(f"追加支払い案件を検出: {project_name}")
-                return 'additional'
-            logging.debug(f"基本案件を検出: {project_name}")
-            return 'basic'
+        if '案件名' in text:
+            project_name = self._find_pattern(text, '案件名')
+            if project_name:
+                if '追加支払い' in project_name:
+                    logging.debug(f"追加支払い案件を検出: {project_name}")
+                    return 'additional'
+                logging.debug(f"基本案件を検出: {project_name}")
+                return 'basic'
+        
+        # 案件名がなければ表形式などの記載から判定
+        logging.debug("表形式から追加支払い案件を検出")
+        return 'additional'
+
+    def _search_areas(self, text: str) -> tuple[str, ...]:
+        """
+        検索対象を冒頭部分、テキスト全体の順に返す
+        
+        冒頭部分は HEAD_SIZE 文字以内の完全な行だけにするため、途中で
+        切れた行を誤って解析することはない。冒頭で見つかった最初の一致は
+        テキスト全体での最初の一致と同じになる。
+        
+        Args:
+            text (str): PDFから抽出したテキスト
+            
+        Returns:
+            tuple[str, ...]: 検索対象（テキストが短ければ全体のみ）
+        """
+        if len(text) <= self.HEAD_SIZE:
+            return (text,)
+        head = text[:self.HEAD_SIZE].rpartition('\n')[0]
+        return (head, text)
+
+    def _find_table_row(self, text: str) -> Optional[str]:
+        """
+        「品名 相⼿先 数量」の見出し行の次にある、空でない行を返す
         
-        # 表形式からも判定
-        if '追加支払い' in text:
-            logging.debug("表形式から追加支払い案件を検出")
-            return 'additional'
+        Args:
+            text (str): PDFから抽出したテキスト
+            
+        Returns:
+            Optional[str]: 表の1行目（見出しが見つからない場合はNone）
+        """
+        # 見出しの文字列がなければ行分割せずに終了
+        if '相⼿先' not in text:
+            return None
         
-        logging.debug("基本案件として判定")
-        return 'basic'
+        lines = text.split('\n')
+        for i, line in enumerate(lines):
+            if line.lstrip().startswith('品名') and '相⼿先' in line:
+                for next_line in lines[i + 1:]:
+                    if next_line.strip():
+                        return next_line
+                return None
+        return None
 
     def extract_project_and_username(self, text: str) -> tuple[str, str]:
         """
@@ -186,21 +561,20 @@ class PDFOrganizer:
         Returns:
             tuple[str, str]: (プロジェクト名, ユーザー名)
         """
-        # 領収書の品名と相手先を抽出するパターン
-        pattern = r'品名\s+相⼿先\s+数量.*?\n(.*?)\s+([a-zA-Z0-9._-]+|[一-龥々ぁ-んァ-ヶ]+\s*[一-龥々ぁ-んァ-ヶ]+|[A-Z]\.\s*[A-Za-z]+)\s+\d+'
-        
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            project = match.group(1).strip()
-            username = match.group(2).strip()
-            
-            # 追加支払いの情報を含める
-            if '追加支払い' in project:
-                project = project.replace('  追加支払い', '') + ' (追加支払い)'
-            
-            logging.debug(f"案件名を検出: {project}")
-            logging.debug(f"相手先を検出: {username}")
-            return project, username
+        for area in self._search_areas(text):
+            table_row = self._find_table_row(area)
+            match = table_row and self.TABLE_ROW_PATTERN.match(table_row)
+            if match:
+                project = match.group(1).strip()
+                username = match.group(2).strip()
+                
+                # 追加支払いの情報を含める
+                if '追加支払い' in project:
+                    project = project.replace('  追加支払い', '') + ' (追加支払い)'
+                
+                logging.debug(f"案件名を検出: {project}")
+                logging.debug(f"相手先を検出: {username}")
+                return project, username
         
         logging.warning(f"案件名または相手先を検出できませんでした。テキストサンプル: {text[:200]}")
         return 'unknown_project', 'unknown_user'
@@ -229,41 +603,55 @@ class PDFOrganizer:
         result_dir.mkdir(parents=True, exist_ok=True)
         
         # 統計情報の初期化
-        project_stats = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-        user_stats = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        # (案件名, ソースディレクトリ, ユーザー名) / (ユーザー名, 案件名, ソースディレクトリ) ごとのファイル数
+        project_stats = Counter()
+        user_stats = Counter()
         
         # ディレクトリ作成
         projects_dir = result_dir / 'projects'
         projects_dir.mkdir(exist_ok=True)
 
         # PDFファイルのリストを取得
-        pdf_files = []
-        source_dirs = set()
-        
-        for folder in self.source_dir.glob('**'):
-            if folder.is_dir():
-                source_dirs.add(folder.relative_to(self.source_dir))
-                logging.info(f"フォルダをスキャン中: {folder.relative_to(self.source_dir)}")
-                pdf_files.extend(folder.glob('*.pdf'))
+        # ループ内でPathオブジェクトを作らないよう、パスは文字列として扱い、
+        # 相対パスはソースディレクトリの接頭辞を取り除いて求める
+        source_root = self.source_dir.absolute()
+        src_prefix = os.path.join(str(source_root), '')
+        pdf_files = sorted({str(p) for p in source_root.rglob('*.pdf')}, key=_path_key)
+        source_dirs = sorted({p[len(src_prefix):].rpartition(os.sep)[0] or '.' for p in pdf_files},
+                             key=_path_key)
+        for folder in source_dirs:
+            logging.info(f"PDFを含むフォルダ: {folder}")
 
-        pdf_files = sorted(set(pdf_files))
         total_files = len(pdf_files)
         logging.info(f"処理開始: 合計 {total_files} 個のPDFファイルを処理します。")
 
+        # ファイルの配置方法
+        place_file = _LinkOrCopy() if self.link_mode == 'auto' else shutil.copy2
+
         # ファイルの分類
-        for i, pdf_path in enumerate(pdf_files, 1):
+        # テキスト抽出（CPUバウンド）は複数プロセスで並列に行い、
+        # 分類とファイルコピーはメインプロセスで順番に処理する
+        # 分類に必要な項目は1ページ目にあるため、揃った時点で読み込みを打ち切る
+        extract = partial(_extract_text, stop_predicate=_has_classification_fields,
+                          debug=logging.getLogger().isEnabledFor(logging.DEBUG))
+        for i, (pdf_path, result, error) in enumerate(_extract_in_pool(extract, pdf_files), 1):
+            relative_path = pdf_path[len(src_prefix):]
+            source_dir, _, file_name = relative_path.rpartition(os.sep)
+            source_dir = source_dir or '.'
             try:
-                relative_path = pdf_path.relative_to(self.source_dir)
-                source_dir = relative_path.parent
                 logging.info(f"処理中 ({i}/{total_files}): {relative_path}")
+                if error is not None:
+                    raise error
+                _, text, records = result
+                for level, message in records:
+                    logging.log(level, message)
                 
-                text = self.extract_text_from_pdf(pdf_path)
                 if not text:
                     # テキスト抽出失敗の場合は_unknownに
                     dest_dir = projects_dir / '_unknown' / source_dir
                     dest_dir.mkdir(parents=True, exist_ok=True)
-                    dest_path = dest_dir / relative_path.name
-                    shutil.copy2(pdf_path, dest_path)
+                    dest_path = dest_dir / file_name
+                    place_file(pdf_path, dest_path)
                     logging.warning(f"テキスト抽出失敗: {relative_path} -> _unknown/{source_dir}")
                     continue
 
@@ -277,58 +665,64 @@ class PDFOrganizer:
                     logging.warning(f"ユーザー名不明: {relative_path} -> _unknown/{source_dir}")
                 else:
                     dest_dir = projects_dir / project_name / source_dir / username
-                    project_stats[project_name][source_dir][username].append(relative_path.name)
-                    user_stats[username][project_name][source_dir].append(relative_path.name)
+                    project_stats[project_name, source_dir, username] += 1
+                    user_stats[username, project_name, source_dir] += 1
                     logging.info(f"分類完了: {relative_path} -> {project_name}/{source_dir}/{username}")
                 
                 dest_dir.mkdir(parents=True, exist_ok=True)
-                dest_path = dest_dir / relative_path.name
-                shutil.copy2(pdf_path, dest_path)
+                dest_path = dest_dir / file_name
+                place_file(pdf_path, dest_path)
                 
             except Exception as e:
                 logging.error(f"ファイル処理エラー: {pdf_path} - {str(e)}")
                 # エラーの場合も_unknownに
                 try:
-                    dest_dir = projects_dir / '_unknown' / relative_path.parent
+                    dest_dir = projects_dir / '_unknown' / source_dir
                     dest_dir.mkdir(parents=True, exist_ok=True)
-                    dest_path = dest_dir / relative_path.name
-                    shutil.copy2(pdf_path, dest_path)
+                    dest_path = dest_dir / file_name
+                    place_file(pdf_path, dest_path)
                     logging.error(f"エラーファイルを_unknownに移動: {relative_path}")
                 except Exception as e2:
                     logging.error(f"_unknownへの移動も失敗: {str(e2)}")
 
         # 統計情報の生成
         stats_file = result_dir / f"classification_stats_{timestamp}.txt"
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            f.write(f"=== 分類結果 ({timestamp}) ===\n\n")
-            
-            f.write("【案件別統計】\n")
-            for project, source_dirs_data in sorted(project_stats.items()):
-                total_files = sum(len(files) for dir_data in source_dirs_data.values() 
-                                for files in dir_data.values())
-                f.write(f"\n案件名: {project}\n")
-                f.write(f"総ファイル数: {total_files}\n")
-                
-                for source_dir, users in sorted(source_dirs_data.items()):
-                    f.write(f"\nソースディレクトリ: {source_dir}\n")
-                    f.write(f"参加者数: {len(users)}\n")
-                    f.write("参加者一覧:\n")
-                    for username, files in sorted(users.items()):
-                        f.write(f"  - {username} ({len(files)}ファイル)\n")
+        buf = []
+        buf.append(f"=== 分類結果 ({timestamp}) ===\n\n")
+        
+        buf.append("【案件別統計】\n")
+        for project, project_group in groupby(sorted(project_stats.items(), key=_project_stats_key),
+                                              key=lambda item: item[0][0]):
+            project_group = list(project_group)
+            total_files = sum(count for _, count in project_group)
+            buf.append(f"\n案件名: {project}\n")
+            buf.append(f"総ファイル数: {total_files}\n")
             
-            f.write("\n【参加者別統計】\n")
-            f.write(f"総参加者数: {len(user_stats)}\n\n")
-            for username, projects in sorted(user_stats.items()):
-                total_files = sum(len(files) for proj_data in projects.values() 
-                                for files in proj_data.values())
-                f.write(f"参加者: {username}\n")
-                f.write(f"総ファイル数: {total_files}\n")
-                f.write("参加案件:\n")
-                for project, source_dirs_data in sorted(projects.items()):
-                    f.write(f"  - {project}\n")
-                    for source_dir, files in sorted(source_dirs_data.items()):
-                        f.write(f"    - {source_dir}: {len(files)}ファイル\n")
-                f.write("\n")
+            for source_dir, users in groupby(project_group, key=lambda item: item[0][1]):
+                users = list(users)
+                buf.append(f"\nソースディレクトリ: {source_dir}\n")
+                buf.append(f"参加者数: {len(users)}\n")
+                buf.append("参加者一覧:\n")
+                for (_, _, username), count in users:
+                    buf.append(f"  - {username} ({count}ファイル)\n")
+        
+        buf.append("\n【参加者別統計】\n")
+        buf.append(f"総参加者数: {len({username for username, _, _ in user_stats})}\n\n")
+        for username, user_group in groupby(sorted(user_stats.items(), key=_user_stats_key),
+                                            key=lambda item: item[0][0]):
+            user_group = list(user_group)
+            total_files = sum(count for _, count in user_group)
+            buf.append(f"参加者: {username}\n")
+            buf.append(f"総ファイル数: {total_files}\n")
+            buf.append("参加案件:\n")
+            for project, source_dirs_data in groupby(user_group, key=lambda item: item[0][1]):
+                buf.append(f"  - {project}\n")
+                for (_, _, source_dir), count in source_dirs_data:
+                    buf.append(f"    - {source_dir}: {count}ファイル\n")
+            buf.append("\n")
+        
+        with open(stats_file, 'w', encoding='utf-8', buffering=WRITE_BUFSIZE) as f:
+            f.writelines(buf)
 
         logging.info(f"統計情報を保存しました: {stats_file}")
         logging.info("\n=== ディレクトリ構造 ===")
@@ -338,31 +732,41 @@ class PDFOrganizer:
         self.save_statistics_csv(result_dir, timestamp, project_stats, user_stats)
 
     def save_statistics_csv(self, result_dir: Path, timestamp: str, 
-                           project_stats: dict, user_stats: dict):
+                           project_stats: Counter, user_stats: Counter):
         """
         統計情報をCSVファイルとして保存する
+        
+        Args:
+            result_dir (Path): 分類結果のディレクトリ
+            timestamp (str): ファイル名に付けるタイムスタンプ
+            project_stats (Counter): (案件名, ソースディレクトリ, ユーザー名) ごとのファイル数
+            user_stats (Counter): (ユーザー名, 案件名, ソースディレクトリ) ごとのファイル数
         """
         csv_dir = result_dir / 'statistics'
         csv_dir.mkdir(exist_ok=True)
         
         # 1. プロジェクト別サマリー
         project_summary_file = csv_dir / f'project_summary_{timestamp}.csv'
-        with open(project_summary_file, 'w', encoding='utf-8') as f:
-            f.write("プロジェクト,ソースディレクトリ,参加者数,ファイル数\n")
-            for project, source_dirs_data in sorted(project_stats.items()):
-                for source_dir, users in sorted(source_dirs_data.items()):
-                    total_files = sum(len(files) for files in users.values())
-                    f.write(f"{project},{source_dir},{len(users)},{total_files}\n")
+        rows = [["プロジェクト", "ソースディレクトリ", "参加者数", "ファイル数"]]
+        for (project, source_dir), users in groupby(sorted(project_stats.items(), key=_project_stats_key),
+                                                    key=lambda item: item[0][:2]):
+            users = list(users)
+            total_files = sum(count for _, count in users)
+            rows.append([project, source_dir, len(users), total_files])
+        with open(project_summary_file, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFSIZE) as f:
+            csv.writer(f, lineterminator='\n').writerows(rows)
         
         # 2. ユーザー別サマリー
         user_summary_file = csv_dir / f'user_summary_{timestamp}.csv'
-        with open(user_summary_file, 'w', encoding='utf-8') as f:
-            f.write("ユーザー名,参加プロジェクト数,総ファイル数\n")
-            for username, projects in sorted(user_stats.items()):
-                project_count = len(projects)
-                total_files = sum(len(files) for proj_data in projects.values() 
-                                for files in proj_data.values())
-                f.write(f"{username},{project_count},{total_files}\n")
+        rows = [["ユーザー名", "参加プロジェクト数", "総ファイル数"]]
+        for username, user_group in groupby(sorted(user_stats.items(), key=_user_stats_key),
+                                            key=lambda item: item[0][0]):
+            user_group = list(user_group)
+            project_count = len({project for (_, project, _), _ in user_group})
+            total_files = sum(count for _, count in user_group)
+            rows.append([username, project_count, total_files])
+        with open(user_summary_file, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFSIZE) as f:
+            csv.writer(f, lineterminator='\n').writerows(rows)
 
         logging.info(f"CSV統計情報を保存しました: {csv_dir}")
 
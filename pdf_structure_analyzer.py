@@ -1,19 +1,51 @@
 import pdfplumber
 import logging
+from array import array
 from pathlib import Path
 from datetime import datetime
 import json
+import re
 from typing import Dict, Any
 
+try:
+    import orjson  # 高速なJSON出力（任意）
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    """JSONに変換できない値（単語位置の配列）をリストに変換する"""
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class PDFStructureAnalyzer:
-    def __init__(self, pdf_path: str):
+    # よくある文字列パターン
+    TEXT_PATTERNS = {
+        '領収書番号': r'領収書番号[：:]\s*([0-9]+)',
+        '発行日': r'発[行⾏]日[：:]\s*(\d{4}年\d{1,2}月\d{1,2}日)',
+        '宛名': r'([一-龥々ぁ-んァ-ヶ\s]{1,20})[様殿]',
+        '領収者': r'領収者[：\s]*([一-龥々ぁ-んァ-ヶ]{1,20})',
+        '金額': r'[￥¥]\s*([0-9,]+)',
+        '案件名': r'案件名[：:]\s*(.+)'
+    }
+    # 事前にコンパイルしたパターン
+    _PATTERNS = {key: re.compile(pattern) for key, pattern in TEXT_PATTERNS.items()}
+
+    def __init__(self, pdf_path: str, extract_words: bool = False,
+                 extract_tables: bool = False, extract_images: bool = False):
         """
         PDFの構造を分析するクラスの初期化
         
         Args:
             pdf_path (str): 分析するPDFファイルのパス
+            extract_words (bool): 単語とその位置情報を抽出するか
+            extract_tables (bool): テーブルを検出するか
+            extract_images (bool): 画像の位置情報を抽出するか
         """
         self.pdf_path = Path(pdf_path)
+        self.extract_words = extract_words
+        self.extract_tables = extract_tables
+        self.extract_images = extract_images
         
         # ログの設定
         log_dir = Path("logs")
@@ -66,7 +98,7 @@ class PDFStructureAnalyzer:
             'height': page.height,
             'text': '',
             'text_by_lines': [],
-            'words': [],
+            'words': {'text': [], 'bbox': array('d')},
             'tables': [],
             'images': []
         }
@@ -80,36 +112,36 @@ class PDFStructureAnalyzer:
                 page_info['text_by_lines'] = page_info['text'].split('\n')
 
             # 単語の抽出（位置情報付き）
-            words = page.extract_words()
-            page_info['words'] = [
-                {
-                    'text': w['text'],
-                    'x0': w['x0'],
-                    'y0': w['y0'],
-                    'x1': w['x1'],
-                    'y1': w['y1']
-                } for w in words
-            ]
+            # 単語ごとの辞書は作らず、位置は (x0, top, x1, bottom) の順に並べた配列で持つ
+            if self.extract_words:
+                words = page.extract_words()
+                page_info['words'] = {
+                    'text': [w['text'] for w in words],
+                    'bbox': array('d', [v for w in words
+                                        for v in (w['x0'], w['top'], w['x1'], w['bottom'])])
+                }
 
             # テーブルの検出
-            tables = page.find_tables()
-            page_info['tables'] = [
-                {
-                    'rows': len(table.rows),
-                    'cols': len(table.cols),
-                    'data': table.extract()
-                } for table in tables
-            ]
+            if self.extract_tables:
+                tables = page.find_tables()
+                page_info['tables'] = [
+                    {
+                        'rows': len(table.rows),
+                        'cols': len(table.cols),
+                        'data': table.extract()
+                    } for table in tables
+                ]
 
             # 画像の検出
-            page_info['images'] = [
-                {
-                    'x0': img['x0'],
-                    'y0': img['y0'],
-                    'x1': img['x1'],
-                    'y1': img['y1']
-                } for img in page.images
-            ]
+            if self.extract_images:
+                page_info['images'] = [
+                    {
+                        'x0': img['x0'],
+                        'y0': img['y0'],
+                        'x1': img['x1'],
+                        'y1': img['y1']
+                    } for img in page.images
+                ]
 
         except Exception as e:
             logging.error(f"ページ {page_num} の分析エラー: {str(e)}")
@@ -118,32 +150,20 @@ class PDFStructureAnalyzer:
 
     def _analyze_text(self, text: str) -> Dict[str, Any]:
         """テキスト全体の分析"""
-        import re
-        
         analysis = {
             'total_length': len(text),
             'line_count': text.count('\n') + 1,
             'patterns_found': {}
         }
 
-        # よくある文字列パターンの検索
-        patterns = {
-            '領収書番号': r'領収書番号[：:]\s*([0-9]+)',
-            '発行日': r'発[行⾏]日[：:]\s*(\d{4}年\d{1,2}月\d{1,2}日)',
-            '宛名': r'([一-龥々ぁ-んァ-ヶ\s]{1,20})[様殿]',
-            '領収者': r'領収者[：\s]*([一-龥々ぁ-んァ-ヶ]{1,20})',
-            '金額': r'[￥¥]\s*([0-9,]+)',
-            '案件名': r'案件名[：:]\s*(.+)'
-        }
-
-        for key, pattern in patterns.items():
-            matches = re.finditer(pattern, text)
+        # 項目ごとに検索する（1つのパターンにまとめると、重なり合う一致が失われる）
+        for key, pattern in self._PATTERNS.items():
             analysis['patterns_found'][key] = [
                 {
                     'matched_text': m.group(0),
                     'captured_group': m.group(1),
                     'position': m.span()
-                } for m in matches
+                } for m in pattern.finditer(text)
             ]
 
         return analysis
@@ -156,15 +176,23 @@ class PDFStructureAnalyzer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = output_path / f"pdf_structure_{self.pdf_path.stem}_{timestamp}.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # orjsonはUTF-8のバイト列を直接出力する
+            data = orjson.dumps(analysis_data, default=_json_default,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            output_file.write_bytes(data)
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(analysis_data, f, ensure_ascii=False, indent=2, default=_json_default)
         
         logging.info(f"分析結果を保存しました: {output_file}")
 
 def main():
     # 使用例
     pdf_path = input("分析したいPDFファイルのパスを入力してください: ")  # 分析したいPDFファイルのパス
-    analyzer = PDFStructureAnalyzer(pdf_path)
+    # 構造の確認用なので、単語・テーブル・画像もすべて出力する
+    analyzer = PDFStructureAnalyzer(pdf_path, extract_words=True,
+                                    extract_tables=True, extract_images=True)
     analysis_result = analyzer.analyze_structure()
     analyzer.save_analysis(analysis_result)
 